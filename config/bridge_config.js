@@ -270,6 +270,36 @@ const HORIZONTAL_CLEARANCES = {
     clear_zone_high_speed: 9.0
 };
 
+// ============================================================================
+// PRECOMPUTED RULE INDEXES
+// Built once at load so lookups by rule_id / element do not rescan every article
+// ============================================================================
+// Null-prototype maps so lookups never resolve inherited keys like "toString"
+const RULES_BY_ID = Object.create(null);
+const RULES_BY_ELEMENT = Object.create(null);
+const NO_RULES = Object.freeze([]);
+
+for (const article of BRIDGE_ARTICLES) {
+    for (const rule of article.rules) {
+        RULES_BY_ID[rule.rule_id] = rule;
+        if (rule.element) {
+            (RULES_BY_ELEMENT[rule.element] = RULES_BY_ELEMENT[rule.element] || []).push(rule);
+        }
+    }
+}
+
+const DWG_CHECKABLE_RULES = Object.values(RULES_BY_ID).filter(rule => rule.dwg_checkable === true);
+
+function get_rule(rule_id) {
+    /**Get rule configuration by ID.*/
+    return RULES_BY_ID[String(rule_id)] || null;
+}
+
+function get_rules_by_element(element) {
+    /**Get all rules that check the given element.*/
+    return RULES_BY_ELEMENT[element] || NO_RULES;
+}
+
 // ============================================================================
 // SUMMARY STATISTICS
 // ============================================================================
@@ -293,11 +323,27 @@ const SUMMARY = {
 
 // ============================================================================
 // EXPORTS
+// Every exported object is frozen so references shared with routes stay read-only
 // ============================================================================
-module.exports = {
+function deepFreeze(value, seen = new WeakSet()) {
+    /**Recursively freeze a config tree, visiting each object once.*/
+    if (value && typeof value === "object" && !seen.has(value)) {
+        seen.add(value);
+        for (const child of Object.values(value)) deepFreeze(child, seen);
+        Object.freeze(value);
+    }
+    return value;
+}
+
+module.exports = deepFreeze({
     BRIDGE_ARTICLES,
+    RULES_BY_ID,
+    RULES_BY_ELEMENT,
+    DWG_CHECKABLE_RULES,
+    get_rule,
+    get_rules_by_element,
     RULE_TYPES,
     VERTICAL_CLEARANCES,
     HORIZONTAL_CLEARANCES,
     SUMMARY
-};
+});
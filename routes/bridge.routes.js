@@ -12,6 +12,7 @@ const { getDb } = require("../database");
 const authMiddleware = require("../middleware/auth.middleware");
 const { uploadDwg } = require("../config/multer.config");
 const { validateFile } = require("../utils/file-validation.util");
+const bridgeConfig = require("../config/bridge_config");
 
 
 // Helper to get collection
@@ -27,11 +28,6 @@ function col(name) {
  */
 router.get("/config", authMiddleware, async (req, res) => {
     try {
-        const configPath = path.join(__dirname, "..", "config", "bridge_config.js");
-        // Clear cache to ensure fresh load
-        delete require.cache[require.resolve(configPath)];
-        const bridgeConfig = require(configPath);
-
         return res.json({
             bridge_articles: bridgeConfig.BRIDGE_ARTICLES,
             signage_articles: bridgeConfig.SIGNAGE_ARTICLES,
@@ -0,0 +1,55 @@
+/**
+ * Verifies the precomputed rule indexes in config/bridge_config.js
+ * against a fresh walk of BRIDGE_ARTICLES.
+ *
+ * Usage: node scripts/verify_bridge_indexes.js
+ */
+const assert = require('assert');
+const {
+    BRIDGE_ARTICLES,
+    RULES_BY_ID,
+    RULES_BY_ELEMENT,
+    DWG_CHECKABLE_RULES,
+    get_rule,
+    get_rules_by_element
+} = require('../config/bridge_config');
+
+function verify() {
+    console.log('=== VERIFYING BRIDGE RULE INDEXES ===');
+
+    const allRules = BRIDGE_ARTICLES.flatMap(article => article.rules);
+
+    // Every rule is reachable by its ID, and nothing else is indexed
+    assert.strictEqual(Object.keys(RULES_BY_ID).length, allRules.length, 'rule_id count mismatch (duplicate IDs?)');
+    for (const rule of allRules) {
+        assert.strictEqual(get_rule(rule.rule_id), rule, `get_rule(${rule.rule_id})`);
+    }
+
+    // Element index lists rules in article order
+    const expectedByElement = {};
+    for (const rule of allRules) {
+        if (rule.element) (expectedByElement[rule.element] = expectedByElement[rule.element] || []).push(rule);
+    }
+    assert.deepStrictEqual(Object.keys(RULES_BY_ELEMENT).sort(), Object.keys(expectedByElement).sort(), 'element keys mismatch');
+    for (const [element, rules] of Object.entries(expectedByElement)) {
+        assert.deepStrictEqual(get_rules_by_element(element), rules, `get_rules_by_element(${element})`);
+    }
+
+    assert.deepStrictEqual(DWG_CHECKABLE_RULES, allRules.filter(rule => rule.dwg_checkable === true), 'DWG_CHECKABLE_RULES mismatch');
+
+    // Misses, including inherited Object keys, return empty results
+    for (const key of ['missing', 'toString', 'constructor', '__proto__']) {
+        assert.strictEqual(get_rule(key), null, `get_rule(${key})`);
+        assert.deepStrictEqual(get_rules_by_element(key), [], `get_rules_by_element(${key})`);
+        assert.ok(Object.isFrozen(get_rules_by_element(key)), `get_rules_by_element(${key}) is mutable`);
+    }
+
+    console.log(`✅ ${allRules.length} rules, ${Object.keys(RULES_BY_ELEMENT).length} elements, ${DWG_CHECKABLE_RULES.length} DWG-checkable`);
+}
+
+try {
+    verify();
+} catch (error) {
+    console.error('❌ Verification failed:', error.message);
+    process.exit(1);
+}